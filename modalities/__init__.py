@@ -1,11 +1,14 @@
-import time
+import operator
+from functools import lru_cache
 from logging import getLogger
 from enum import IntFlag
-from typing import Union, List, Optional
+from typing import TYPE_CHECKING, Dict, Tuple, Union, List, Optional
 
-import numpy as np
 from aenum import extend_enum
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = getLogger(__name__)
 
 
@@ -53,14 +56,11 @@ class Modality(IntFlag):
             >>> Modality.from_str("IMAGE_TEXT")
             <Modality.IMAGE|TEXT: 3>
         """
-        modalities = [m.strip().upper() for m in s.split("_")]
-        result = Modality(0)
-        for m in modalities:
-            try:
-                result |= Modality[m]
-            except KeyError:
-                return Modality.INVALID
-        return result if result != Modality.INVALID else Modality.INVALID
+        # Fast path for exact member names, which is the common case
+        member = _NAME_TO_MEMBER.get(s)
+        if member is not None:
+            return member
+        return _parse(s)
 
     def __str__(self) -> str:
         """
@@ -73,19 +73,17 @@ class Modality(IntFlag):
             >>> str(Modality.IMAGE | Modality.TEXT)
             'IMAGE_TEXT'
         """
-        if self == Modality.INVALID:
-            return "INVALID"
-
-        components = set()
-        for m in Modality:
-            if m in self and m != Modality.INVALID:
-                # Split compound names and add individual components
-                components.update(m.name.split("_"))
-
-        return "_".join(sorted(components))
+        value = self.value
+        cached = _STR_CACHE.get(value)
+        if cached is None:
+            cached = _STR_CACHE[value] = _format_value(value)
+        return cached
 
     def __repr__(self) -> str:
-        return f"Modality({self.__str__()})"
+        cached = _REPR_CACHE.get(self.value)
+        if cached is None:
+            cached = _REPR_CACHE[self.value] = f"Modality({self.__str__()})"
+        return cached
 
     def __or__(self, other: "Modality") -> "Modality":
         """
@@ -102,7 +100,11 @@ class Modality(IntFlag):
             <Modality.IMAGE|TEXT: 3>
         """
         if isinstance(other, Modality):
-            return Modality(self.value | other.value)
+            # OR the raw ints and reuse the cached member for the result,
+            # only going through the enum constructor for unseen values
+            value = int.__or__(self, other)
+            member = Modality._value2member_map_.get(value)
+            return member if member is not None else Modality(value)
         return NotImplemented
 
     def __add__(self, other: "Modality") -> "Modality":
@@ -134,6 +136,121 @@ class Modality(IntFlag):
         return self.__add__(other)
 
 
+# Name -> member lookup used by ``Modality.from_str``, kept in sync by ``add_modality``.
+_NAME_TO_MEMBER: Dict[str, Modality] = dict(Modality.__members__)
+
+
+@lru_cache(maxsize=1024)
+def _parse(s: str) -> Modality:
+    """Return the Modality for ``s``, or INVALID if any component is unknown."""
+    # Whole names may contain underscores themselves (e.g. "SUPER_COMBO"),
+    # so try the normalized name before splitting it into components
+    member = _NAME_TO_MEMBER.get(s.strip().upper())
+    if member is not None:
+        return member
+    result = 0
+    for m in s.split("_"):
+        member = _NAME_TO_MEMBER.get(m)
+        if member is None:
+            member = _NAME_TO_MEMBER.get(m.strip().upper())
+        if member is None:
+            return Modality.INVALID
+        result |= member.value
+    return Modality(result)
+
+
+def _format_value(value: int) -> str:
+    """Spell ``value`` from the current base modality names, bypassing the cache."""
+    if not value:
+        return "INVALID"
+    # Visit only the set bits, lowest first
+    parts = []
+    remaining = value
+    while remaining:
+        bit = remaining & -remaining
+        name = _BIT_NAME.get(bit)
+        if name is not None:
+            parts.append(name)
+        remaining ^= bit
+    return "_".join(sorted(parts))
+
+
+# Formatted names per flag value. Adding a modality can change how existing
+# values are spelled, so ``add_modality`` clears both caches.
+_STR_CACHE: Dict[int, str] = {}
+_REPR_CACHE: Dict[int, str] = {}
+
+# Names of the base (single-bit) modalities used by ``Modality.__str__``, and
+# the next free bit for a base modality. Both are updated by ``add_modality``
+# so hot paths avoid re-iterating the enum.
+_BIT_NAME: Dict[int, str] = {
+    m.value: m.name for m in Modality if m.value and not m.value & (m.value - 1)
+}
+_NEXT_ATOMIC_VALUE: int = 1 << max(_BIT_NAME).bit_length()
+
+
+def _validate_spec(name: Optional[str], combination: Optional[Modality]) -> None:
+    """Raise if ``(name, combination)`` cannot be passed to ``add_modality``."""
+    if combination is None:
+        if name is None:
+            raise ValueError("Name must be provided when creating a new base modality.")
+    elif not isinstance(combination, Modality):
+        raise TypeError(
+            f"combination must be a Modality, not {type(combination).__name__}."
+        )
+
+
+def _register_modality(
+    name: Optional[str], combination: Optional[Modality]
+) -> Tuple[Modality, bool]:
+    """
+    Extend the Modality enum without refreshing the caches derived from it.
+
+    Returns:
+        Tuple[Modality, bool]: The modality and whether it was newly created.
+    """
+    global _NEXT_ATOMIC_VALUE
+
+    _validate_spec(name, combination)
+    if combination is None:
+        new_value = _NEXT_ATOMIC_VALUE
+    else:
+        new_value = combination.value
+        if name is None:
+            # The name cache may be stale partway through a batch, so spell
+            # the name from the current base modalities directly
+            name = _format_value(new_value)
+
+    name = name.upper()
+    existing = _NAME_TO_MEMBER.get(name)
+    if existing is not None:
+        return existing, False
+
+    new_member = extend_enum(Modality, name, new_value)
+    _NAME_TO_MEMBER[name] = new_member
+    # Name every single-bit value, whether it came from a new base modality
+    # or from an explicit combination; an existing name for the bit wins
+    if new_value and not new_value & (new_value - 1):
+        _BIT_NAME.setdefault(new_value, name)
+    # Keep the next base value above every bit in use, including bits first
+    # introduced through an explicit combination
+    _NEXT_ATOMIC_VALUE = max(_NEXT_ATOMIC_VALUE, 1 << new_value.bit_length())
+    logger.debug(f"Added new modality: {name}")
+    return new_member, True
+
+
+def _refresh_caches() -> None:
+    """Rebuild every cache derived from the Modality members."""
+    global _DISPATCH
+
+    _STR_CACHE.clear()
+    _REPR_CACHE.clear()
+    # Previously unknown names may now parse to a valid modality
+    _parse.cache_clear()
+    _DISPATCH = _build_dispatch()
+    _prime_messages()
+
+
 def add_modality(
     name: Optional[str] = None, combination: Optional[Modality] = None
 ) -> Modality:
@@ -154,115 +271,190 @@ def add_modality(
         >>> video = add_modality("VIDEO")
         >>> video_text = add_modality(combination=video | Modality.TEXT)
     """
-    if combination is None:
-        if name is None:
-            raise ValueError("Name must be provided when creating a new base modality.")
-        new_value = max(int(m.value) for m in Modality) * 2
-    else:
-        new_value = combination.value
-        if name is None:
-            name = str(combination)
+    member, created = _register_modality(name, combination)
+    if created:
+        _refresh_caches()
+    return member
 
-    name = name.upper()
-    if name in Modality.__members__:
-        return  Modality[name]
 
-    new_member = extend_enum(Modality, name, new_value)
-    logger.debug(f"Added new modality: {name}")
-    return new_member
-
-
-def process_modality(mod):
-    match mod:
-        case Modality.INVALID:
-            return "Invalid modality"
-        case Modality.IMAGE | Modality.TEXT:
-            return f"Processing image and text: {mod}"
-        case Modality.AUDIO | Modality.TEXT:
-            return f"Processing audio and text: {mod}"
-        case Modality.IMAGE:
-            return f"Processing image only: {mod}"
-        case Modality.TEXT:
-            return f"Processing text only: {mod}"
-        case Modality.VIDEO:
-            return f"Processing video: {mod}"
-        case _:
-            return f"Processing other combination: {mod}"
+def add_modalities(
+    specs: List[Tuple[Optional[str], Optional[Modality]]]
+) -> List[Modality]:
+    """
+    Add several modalities at once, rebuilding the internal caches only once.
+
+    Args:
+        specs (List[Tuple[Optional[str], Optional[Modality]]]): ``(name, combination)``
+            pairs, each interpreted as the arguments to ``add_modality``.
+
+    Returns:
+        List[Modality]: The modalities, in the same order as ``specs``.
+
+    Example:
+        >>> image_audio, image_text = add_modalities(
+        ...     [("IMAGE_AUDIO", Modality.IMAGE | Modality.AUDIO),
+        ...      ("IMAGE_TEXT", Modality.IMAGE | Modality.TEXT)]
+        ... )
+    """
+    specs = list(specs)
+    # Validate everything up front so a bad entry does not leave the batch
+    # half-registered
+    for name, combination in specs:
+        _validate_spec(name, combination)
+
+    members = []
+    created_any = False
+    try:
+        for name, combination in specs:
+            member, created = _register_modality(name, combination)
+            members.append(member)
+            created_any = created_any or created
+    finally:
+        # Entries registered before a failing spec stay in the enum, so the
+        # caches must reflect them even if the batch is cut short
+        if created_any:
+            _refresh_caches()
+    return members
+
+
+def _build_dispatch() -> Dict[int, str]:
+    """Map flag values to the prefix of their ``process_modality`` message."""
+    image, text, audio = int(Modality.IMAGE), int(Modality.TEXT), int(Modality.AUDIO)
+    dispatch = {
+        image | text: "Processing image and text: ",
+        audio | text: "Processing audio and text: ",
+        image: "Processing image only: ",
+        text: "Processing text only: ",
+    }
+    # VIDEO is not predefined, so its prefix is only registered once it exists
+    video = _NAME_TO_MEMBER.get("VIDEO")
+    if video is not None:
+        dispatch.setdefault(int(video), "Processing video: ")
+    return dispatch
+
+
+_INVALID_MESSAGE = "Invalid modality"
+_OTHER_PREFIX = "Processing other combination: "
+
+
+def process_modality(mod: Union[Modality, int]) -> str:
+    """
+    Describe how a modality, or combination of modalities, would be processed.
+
+    Combinations are matched by value, so ``Modality.IMAGE | Modality.TEXT``
+    only matches when both flags are set.
+
+    Args:
+        mod (Union[Modality, int]): The modality to process, or its integer
+                                    value (e.g. an element of an int64 mask array).
+
+    Returns:
+        str: A description of the processing step.
+
+    Raises:
+        ValueError: If ``mod`` is a negative integer.
+    """
+    # operator.index accepts Modality, int and NumPy integers but rejects
+    # floats, which int() would silently truncate
+    value = operator.index(mod)
+    # INVALID and every dispatched value are pre-formatted by _prime_messages
+    message = _MESSAGES.get(value)
+    if message is not None:
+        return message
+    if value < 0:
+        raise ValueError(f"Modality values cannot be negative, got {value}.")
+    # Other combinations are formatted on demand and not cached, so arbitrary
+    # masks cannot grow the message or name caches without bound
+    return _OTHER_PREFIX + _format_value(value)
+
+
+def _prime_messages() -> None:
+    """Reset the message cache and pre-format every dispatched modality."""
+    _MESSAGES.clear()
+    # INVALID has a fixed message, so it lives in the cache as a sentinel entry
+    _MESSAGES[int(Modality.INVALID)] = _INVALID_MESSAGE
+    for value, prefix in _DISPATCH.items():
+        _MESSAGES[value] = prefix + str(Modality(value))
+
+
+_DISPATCH: Dict[int, str] = _build_dispatch()
+# Fully formatted messages for INVALID and the dispatched values, rebuilt by
+# ``add_modality``
+_MESSAGES: Dict[int, str] = {}
+_prime_messages()
 
 
 def create_missing_mask(
     n: int,
     m: int,
-    pct_missing: float | List[float] | np.ndarray,
+    pct_missing: "float | List[float] | np.ndarray",
     seed: Optional[int] = None,
-) -> np.ndarray:
+) -> "np.ndarray":
     """
     Generate a mask representing missing data across multiple modalities and samples.
-    Optimized version that guarantees at least one present value per row efficiently.
+    Guarantees that every sample (row) has at least one present modality.
+
+    Args:
+        n (int): The number of modalities (columns).
+        m (int): The number of samples (rows).
+        pct_missing (float | List[float] | np.ndarray): The fraction of missing
+            samples, either shared by all modalities or given per modality.
+        seed (Optional[int]): Seed for the random number generator. If None,
+            fresh entropy is drawn from the operating system.
 
-    Parameters and returns are same as before, but with improved performance.
+    Returns:
+        np.ndarray: An (m, n) ``uint8`` mask where 1 marks a present value and
+                    0 a missing one. Use ``mask.view(bool)`` for a boolean view
+                    without copying.
     """
-    if seed is None:
-        seed = int(time.time())
+    # Imported here so that ``import modalities`` does not pull in numpy
+    import numpy as np
 
     rng = np.random.default_rng(seed)  # Use the newer numpy random generator
 
-    if isinstance(pct_missing, (float, int)):
-        pct_missing = [pct_missing] * n
+    pct_missing = np.asarray(pct_missing, dtype=np.float64)
+    if pct_missing.ndim == 0:
+        pct_missing = np.full(n, pct_missing)
 
-    assert all(
-        0.0 <= r <= 1.0 for r in pct_missing
+    assert np.all(
+        (pct_missing >= 0.0) & (pct_missing <= 1.0)
     ), "All pct_missings must be between 0.0 and 1.0"
     assert (
         len(pct_missing) == n
     ), f"Length of pct_missing ({len(pct_missing)}) must match the number of modalities ({n})"
 
     # Check feasibility
-    min_present_per_column = np.array([m * (1 - p) for p in pct_missing])
+    min_present_per_column = m * (1 - pct_missing)
     assert np.sum(min_present_per_column) >= m, (
         "The requested missing percentages would make it impossible to guarantee at least "
         "one present value per row. Please reduce the missing percentages."
     )
 
-    mask = np.ones((m, n))
-    
+    mask = np.ones((m, n), dtype=np.uint8)
+
     # Pre-calculate missing counts
-    missing_counts = [int(m * p) for p in pct_missing]
-    
-    # First, ensure each row has at least one guaranteed present value
-    # We'll distribute these guarantees across columns proportionally
-    remaining_rows = set(range(m))
-    for i in range(n):
-        if not remaining_rows:  # If all rows have a guarantee, break
-            break
-            
-        # Calculate how many guarantees this column should provide
-        present_count = m - missing_counts[i]
-        if present_count <= 0:
-            continue
-            
-        # Select rows for this column's guarantees
-        rows_to_guarantee = rng.choice(
-            list(remaining_rows),
-            size=min(present_count, len(remaining_rows)),
-            replace=False
-        )
-        remaining_rows -= set(rows_to_guarantee)
-        
-        # These rows are guaranteed to have a present value in this column
-        missing_counts[i] -= len(rows_to_guarantee)
-
-    # Now fill in the rest of the missing values
-    for i in range(n):
-        # Get available rows (those without guarantees can be made missing)
-        available_rows = np.where(mask[:, i] == 1)[0]
-        if missing_counts[i] > 0:
-            # Select rows to mark as missing
-            masked_indices = rng.choice(
-                available_rows,
-                size=missing_counts[i],
-                replace=False
-            )
-            mask[masked_indices, i] = 0.0
-
-    return mask
\ No newline at end of file
+    missing_counts = (m * pct_missing).astype(np.int64)
+
+    # First, ensure each row has at least one guaranteed present value.
+    # Rows are shuffled and handed out to the columns in order, each column
+    # taking as many rows as it has present values. The feasibility check
+    # above ensures every row is handed out.
+    owner = np.searchsorted(
+        np.cumsum(m - missing_counts), np.arange(m), side="right"
+    )
+    guaranteed = np.zeros((m, n), dtype=bool)
+    guaranteed[rng.permutation(m), owner] = True
+
+    # Now fill in the missing values in one pass: draw a random key per cell
+    # and mark the missing_counts[i] lowest keys of each column as missing.
+    # Guaranteed cells get an infinite key so they are never picked. Only the
+    # selected rows matter, so a partial partition at each distinct count is
+    # enough; a full sort of every column is not needed.
+    keys = rng.random((m, n))
+    keys[guaranteed] = np.inf
+    kth = np.unique(missing_counts[(missing_counts > 0) & (missing_counts < m)])
+    order = np.argpartition(keys, kth, axis=0)
+    is_missing = np.arange(m)[:, None] < missing_counts
+    np.put_along_axis(mask, order, (~is_missing).astype(np.uint8), axis=0)
+
+    return mask
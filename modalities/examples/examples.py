@@ -1,90 +1,88 @@
-import sys
-
-sys.path.append("..")
+if __name__ == "__main__":
+    import os
+    import sys
 
-from modalities import Modality, add_modality
+    # Make the repository root importable when run as a script
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
 
+    from modalities import Modality, add_modalities, add_modality, process_modality
 
-def process_modality(mod):
-    match mod:
-        case Modality.INVALID:
-            return "Invalid modality"
-        case Modality.IMAGE | Modality.TEXT:
-            return f"Processing image and text: {mod}"
-        case Modality.AUDIO | Modality.TEXT:
-            return f"Processing audio and text: {mod}"
-        case Modality.IMAGE:
-            return f"Processing image only: {mod}"
-        case Modality.TEXT:
-            return f"Processing text only: {mod}"
-        case Modality.VIDEO:
-            return f"Processing video: {mod}"
-        case _:
-            return f"Processing other combination: {mod}"
+    # Combinations reused throughout the examples
+    IMAGE_TEXT = Modality.IMAGE | Modality.TEXT
+    IMAGE_AUDIO = Modality.IMAGE | Modality.AUDIO
+    AUDIO_TEXT = Modality.AUDIO | Modality.TEXT
+    TEXT_AUDIO_IMAGE = Modality.TEXT | Modality.AUDIO | Modality.IMAGE
 
+    # Collect the output and write it once at the end; entries are converted
+    # with str() only when joined
+    out = []
 
-if __name__ == "__main__":
     # Test basic modality combinations
-    print(str(Modality.IMAGE | Modality.TEXT))  # Should print: IMAGE_TEXT
-    print(
-        str(Modality.TEXT | Modality.IMAGE)
+    out.append(IMAGE_TEXT)  # Should print: IMAGE_TEXT
+    out.append(
+        Modality.TEXT | Modality.IMAGE
     )  # Should print: IMAGE_TEXT (order shouldn't matter)
 
     # Test from_str method
-    print(
+    out.append(
         Modality.from_str("IMAGE_TEXT")
     )  # Should be equal to Modality.IMAGE | Modality.TEXT
-    print(
+    out.append(
         Modality.from_str("TEXT_IMAGE")
     )  # Should be equal to Modality.IMAGE | Modality.TEXT
-    print(
+    out.append(
         Modality.from_str("AUDIO_TEXT")
     )  # Should be equal to Modality.AUDIO | Modality.TEXT
-    print(Modality.from_str("IMAGE"))  # Should be equal to Modality.IMAGE
-    print(Modality.from_str("INVALID"))  # Should be equal to Modality.INVALID
+    out.append(Modality.from_str("IMAGE"))  # Should be equal to Modality.IMAGE
+    out.append(Modality.from_str("INVALID"))  # Should be equal to Modality.INVALID
 
     # Test adding new modalities
     video = add_modality("VIDEO")
-    print(str(video))  # Should print: VIDEO
-    video_text = add_modality("VIDEO_TEXT", video | Modality.TEXT)
-    print(str(video_text))  # Should print: VIDEO_TEXT
+    out.append(video)  # Should print: VIDEO
+
+    # Register all the combined modalities in one batch
+    image_audio_text = IMAGE_AUDIO | TEXT_AUDIO_IMAGE
+    video_text, image_text, image_audio, text_audio_image, super_combo = add_modalities(
+        [
+            ("VIDEO_TEXT", video | Modality.TEXT),
+            ("IMAGE_TEXT", IMAGE_TEXT),
+            ("IMAGE_AUDIO", IMAGE_AUDIO),
+            ("TEXT_AUDIO_IMAGE", TEXT_AUDIO_IMAGE),
+            ("SUPER_COMBO", image_audio_text),
+        ]
+    )
+    out.append(video_text)  # Should print: VIDEO_TEXT
 
     # Test process_modality function
-    print(process_modality(Modality.IMAGE | Modality.TEXT))
-    print(process_modality(Modality.AUDIO | Modality.TEXT))
-    print(process_modality(Modality.IMAGE))
-    print(process_modality(Modality.INVALID))
-    print(process_modality(Modality.from_str("IMAGE_TEXT")))
+    out.append(process_modality(IMAGE_TEXT))
+    out.append(process_modality(AUDIO_TEXT))
+    out.append(process_modality(Modality.IMAGE))
+    out.append(process_modality(Modality.INVALID))
+    out.append(process_modality(Modality.from_str("IMAGE_TEXT")))
 
     # Test with new combined modalities
-    image_text = add_modality("IMAGE_TEXT", Modality.IMAGE | Modality.TEXT)
-    print(process_modality(image_text))
-    print(process_modality(video_text))
+    out.append(process_modality(image_text))
+    out.append(process_modality(video_text))
     # Test add_modality with combinations
-    image_audio = add_modality("IMAGE_AUDIO", Modality.IMAGE | Modality.AUDIO)
-    print(f"New modality: {image_audio}")
-    print(
-        f"IMAGE_AUDIO == IMAGE | AUDIO: {image_audio == (Modality.IMAGE | Modality.AUDIO)}"
-    )
+    out.append(f"New modality: {image_audio}")
+    out.append(f"IMAGE_AUDIO == IMAGE | AUDIO: {image_audio == IMAGE_AUDIO}")
 
-    text_audio_image = add_modality(
-        "TEXT_AUDIO_IMAGE", Modality.TEXT | Modality.AUDIO | Modality.IMAGE
-    )
-    print(f"New modality: {text_audio_image}")
-    print(
-        f"TEXT_AUDIO_IMAGE == TEXT | AUDIO | IMAGE: {text_audio_image == (Modality.TEXT | Modality.AUDIO | Modality.IMAGE)}"
+    out.append(f"New modality: {text_audio_image}")
+    out.append(
+        f"TEXT_AUDIO_IMAGE == TEXT | AUDIO | IMAGE: {text_audio_image == TEXT_AUDIO_IMAGE}"
     )
 
     # Test using the new combined modalities
-    print(process_modality(image_audio))
-    print(process_modality(text_audio_image))
+    out.append(process_modality(image_audio))
+    out.append(process_modality(text_audio_image))
 
     # Test combining existing combined modalities
-    super_combo = add_modality("SUPER_COMBO", image_audio | text_audio_image)
-    print(f"New modality: {super_combo}")
-    print(
-        f"SUPER_COMBO == IMAGE_AUDIO | TEXT_AUDIO_IMAGE: {super_combo == (image_audio | text_audio_image)}"
+    out.append(f"New modality: {super_combo}")
+    out.append(
+        f"SUPER_COMBO == IMAGE_AUDIO | TEXT_AUDIO_IMAGE: {super_combo == image_audio_text}"
     )
-    print(process_modality(super_combo))
+    out.append(process_modality(super_combo))
 
-    add_modality("VIDEO")
+    sys.stdout.write("\n".join(map(str, out)) + "\n")
@@ -0,0 +1,53 @@
+import pytest
+
+import modalities
+from modalities import Modality, add_modalities, process_modality
+
+
+def test_invalid_spec_registers_nothing():
+    with pytest.raises(ValueError):
+        add_modalities([("THERMAL", None), (None, None)])
+    assert "THERMAL" not in Modality.__members__
+
+
+def test_non_modality_combination_is_rejected():
+    with pytest.raises(TypeError):
+        add_modalities([("LIDAR", None), ("LIDAR_TEXT", 2)])
+    assert "LIDAR" not in Modality.__members__
+
+
+def test_failed_batch_refreshes_caches_for_registered_entries(monkeypatch):
+    # Prime the parse cache so a missing refresh would leave it stale
+    assert Modality.from_str("depth") is Modality.INVALID
+
+    extend_enum = modalities.extend_enum
+    calls = []
+
+    def failing_extend_enum(*args):
+        calls.append(args)
+        if len(calls) > 1:
+            raise RuntimeError("registration failed")
+        return extend_enum(*args)
+
+    monkeypatch.setattr(modalities, "extend_enum", failing_extend_enum)
+    with pytest.raises(RuntimeError):
+        add_modalities([("DEPTH", None), ("RADAR", None)])
+
+    depth = Modality["DEPTH"]
+    assert Modality.from_str("depth") is depth
+    assert str(depth | Modality.IMAGE) == "DEPTH_IMAGE"
+    assert process_modality(depth) == "Processing other combination: DEPTH"
+
+
+def test_generated_names_ignore_stale_name_cache():
+    # Format the value before its new bit has a name, caching a stale spelling
+    value = modalities._NEXT_ATOMIC_VALUE | Modality.IMAGE.value
+    assert str(Modality(value)) == "IMAGE"
+
+    sonar, sonar_image = add_modalities([("SONAR", None), (None, Modality(value))])
+
+    assert int(sonar) | Modality.IMAGE.value == value
+    assert sonar_image is not Modality.IMAGE
+    assert Modality["IMAGE_SONAR"] is sonar_image
+    assert int(sonar_image) == value
+    assert str(sonar_image) == "IMAGE_SONAR"
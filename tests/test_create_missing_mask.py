@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from modalities import create_missing_mask
+
+
+@pytest.mark.parametrize(
+    "n, m, pct_missing",
+    [
+        (2, 5, [0.3, 0.4]),
+        (3, 10, [0.5, 0.5, 0.5]),
+        (4, 37, [0.9, 0.1, 0.6, 0.25]),
+        (1, 20, [0.0]),
+        (3, 6, [1.0, 0.5, 0.5]),
+    ],
+)
+@pytest.mark.parametrize("seed", [0, 1, 42])
+def test_exact_counts_and_row_guarantee(n, m, pct_missing, seed):
+    mask = create_missing_mask(n, m, pct_missing, seed=seed)
+
+    assert mask.shape == (m, n)
+    assert mask.dtype == np.uint8
+    assert set(np.unique(mask)) <= {0, 1}
+    # Each column has exactly int(m * pct) missing values
+    expected = [int(m * p) for p in pct_missing]
+    assert (mask == 0).sum(axis=0).tolist() == expected
+    # Every row keeps at least one present modality
+    assert (mask.sum(axis=1) >= 1).all()
+
+
+def test_scalar_pct_missing_matches_list():
+    scalar = create_missing_mask(3, 12, 0.5, seed=7)
+    listed = create_missing_mask(3, 12, [0.5, 0.5, 0.5], seed=7)
+    array = create_missing_mask(3, 12, np.array([0.5, 0.5, 0.5]), seed=7)
+
+    assert (scalar == listed).all()
+    assert (scalar == array).all()
+    assert (scalar == 0).sum(axis=0).tolist() == [6, 6, 6]
+
+
+def test_no_missing_values():
+    mask = create_missing_mask(2, 8, 0.0, seed=3)
+    assert (mask == 1).all()
+
+
+def test_fully_missing_column():
+    mask = create_missing_mask(2, 8, [1.0, 0.0], seed=3)
+    assert (mask[:, 0] == 0).all()
+    assert (mask[:, 1] == 1).all()
+
+
+def test_same_seed_is_reproducible():
+    first = create_missing_mask(3, 50, [0.2, 0.4, 0.6], seed=11)
+    second = create_missing_mask(3, 50, [0.2, 0.4, 0.6], seed=11)
+    assert (first == second).all()
+
+
+@pytest.mark.parametrize(
+    "n, pct_missing",
+    [
+        (2, [0.5]),  # wrong length
+        (2, [1.5, 0.1]),  # out of range
+        (2, [0.9, 0.9]),  # cannot keep a present value in every row
+    ],
+)
+def test_invalid_pct_missing(n, pct_missing):
+    with pytest.raises(AssertionError):
+        create_missing_mask(n, 10, pct_missing)
@@ -0,0 +1,32 @@
+import pytest
+
+from modalities import Modality, add_modality
+
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        ("IMAGE", Modality.IMAGE),
+        ("image", Modality.IMAGE),
+        ("IMAGE_TEXT", Modality.IMAGE | Modality.TEXT),
+        ("text_image", Modality.IMAGE | Modality.TEXT),
+        (" Audio _ text ", Modality.AUDIO | Modality.TEXT),
+        ("INVALID", Modality.INVALID),
+        ("unknown", Modality.INVALID),
+        ("IMAGE_unknown", Modality.INVALID),
+    ],
+)
+def test_from_str(s, expected):
+    assert Modality.from_str(s) is expected
+
+
+@pytest.mark.parametrize("s", ["DEPTH_MAP", "depth_map", "Depth_Map", " DEPTH_MAP "])
+def test_from_str_resolves_underscored_names_in_any_case(s):
+    depth_map = add_modality("DEPTH_MAP")
+    assert Modality.from_str(s) is depth_map
+
+
+@pytest.mark.parametrize("s", ["SUPER_COMBO", "super_combo", " SUPER_COMBO"])
+def test_from_str_resolves_combination_names_in_any_case(s):
+    super_combo = add_modality("SUPER_COMBO", Modality.IMAGE | Modality.AUDIO)
+    assert Modality.from_str(s) is super_combo
@@ -0,0 +1,84 @@
+import pytest
+
+import modalities
+from modalities import Modality, add_modality, process_modality
+
+
+# Parallel tables of integer masks and the message each one produces
+MASKS = (
+    int(Modality.IMAGE | Modality.TEXT),
+    int(Modality.AUDIO | Modality.TEXT),
+    int(Modality.IMAGE),
+    int(Modality.INVALID),
+    int(Modality.from_str("IMAGE_TEXT")),
+)
+EXPECTED = (
+    "Processing image and text: IMAGE_TEXT",
+    "Processing audio and text: AUDIO_TEXT",
+    "Processing image only: IMAGE",
+    "Invalid modality",
+    "Processing image and text: IMAGE_TEXT",
+)
+
+
+@pytest.mark.parametrize("mask, expected", list(zip(MASKS, EXPECTED)))
+def test_process_modality_masks(mask, expected):
+    assert process_modality(mask) == expected
+    assert process_modality(Modality(mask)) == expected
+
+
+def test_unlisted_combinations_are_not_cached():
+    cached = len(modalities._MESSAGES)
+    for value in range(16, 1016):
+        process_modality(value)
+    assert len(modalities._MESSAGES) == cached
+
+
+@pytest.mark.parametrize("mod", [-1, -3])
+def test_negative_values_are_rejected(mod):
+    with pytest.raises(ValueError):
+        process_modality(mod)
+
+
+@pytest.mark.parametrize("mod", [3.7, 3.0, "IMAGE_TEXT"])
+def test_non_integer_values_are_rejected(mod):
+    with pytest.raises(TypeError):
+        process_modality(mod)
+
+
+@pytest.mark.parametrize(
+    "mod, expected",
+    [
+        (Modality.INVALID, "Invalid modality"),
+        (Modality.IMAGE | Modality.TEXT, "Processing image and text: IMAGE_TEXT"),
+        (Modality.AUDIO | Modality.TEXT, "Processing audio and text: AUDIO_TEXT"),
+        (Modality.IMAGE, "Processing image only: IMAGE"),
+        (Modality.TEXT, "Processing text only: TEXT"),
+    ],
+)
+def test_dispatch_entries(mod, expected):
+    assert process_modality(mod) == expected
+
+
+@pytest.mark.parametrize(
+    "mod, expected",
+    [
+        (Modality.AUDIO, "Processing other combination: AUDIO"),
+        (Modality.MULTIMODAL, "Processing other combination: MULTIMODAL"),
+        (Modality.IMAGE | Modality.AUDIO, "Processing other combination: AUDIO_IMAGE"),
+        (
+            Modality.IMAGE | Modality.TEXT | Modality.AUDIO,
+            "Processing other combination: AUDIO_IMAGE_TEXT",
+        ),
+    ],
+)
+def test_dispatch_fallback(mod, expected):
+    assert process_modality(mod) == expected
+
+
+def test_video_dispatch_is_registered_with_video():
+    video = add_modality("VIDEO")
+    assert process_modality(video) == "Processing video: VIDEO"
+    assert process_modality(video | Modality.TEXT) == (
+        "Processing other combination: TEXT_VIDEO"
+    )